@@ -17,18 +17,22 @@ import sys
 import socket
 import os
 import re
+import bisect
+import functools
+import mmap
+import pickle
 import subprocess
-import shutil
 import tempfile
 import time
+from collections import namedtuple
 from PySide6.QtWidgets import (QApplication, QMainWindow, QTreeWidget, QTreeWidgetItem,
                                QMessageBox, QVBoxLayout, QWidget, QDialog, QLabel,
                                QFormLayout, QToolBar, QStyle, QTabWidget, QGroupBox,
                                QLineEdit, QTextEdit, QFrame, QMenu,
                                QDialogButtonBox, QHBoxLayout, QPushButton, QComboBox,
                                QSizePolicy)
-from PySide6.QtCore import Qt, QSize, QSocketNotifier, Slot, QTimer
-from PySide6.QtGui import QIcon, QAction, QFont, QPainter, QPixmap
+from PySide6.QtCore import Qt, QSize, QSocketNotifier, Slot, QTimer, QThread, Signal
+from PySide6.QtGui import QIcon, QAction, QFont, QPainter, QPixmap, QPixmapCache, QGuiApplication
 
 import pyudev
 
@@ -36,6 +40,90 @@ import pyudev
 GITHUB_URL = "https://github.com/lolren/LinMan-Linux-Device-Manager"
 VERSION = "1.3.6"
 HANDSHAKE_FILE = os.path.join(tempfile.gettempdir(), "linman_root_active.lock")
+IDS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "linman")
+
+# Application-wide stylesheet. The per-dialog setStyleSheet literals it
+# replaces made Qt spin up its CSS engine for each widget every time a
+# properties dialog opened; one app-level sheet with objectName
+# selectors is parsed a single time at startup instead.
+# Only structural rules live here; anything expressible as a plain
+# widget property (fonts, palette colors) is set in code, which skips
+# the QStyleSheetStyle selector matcher for those widgets entirely.
+_APP_QSS = """
+QTextEdit#deviceStatus { border: 1px solid palette(mid); }
+"""
+
+_THEMES = {
+    'default': _APP_QSS,
+}
+# Sheets are authored readably and compacted once at import, so Qt's
+# CSS tokenizer only ever sees the minimal form. None of the current
+# rules share a declaration block, so there is nothing to group.
+# Interning pins one canonical string per theme, so every consumer
+# hands the same object across the Qt boundary.
+_THEMES = {name: sys.intern(' '.join(sheet.split())) for name, sheet in _THEMES.items()}
+
+@functools.lru_cache(maxsize=4)
+def _qss(theme):
+    """Assembled sheet for a theme; reapplications return the one cached
+    string, so Qt can short-circuit on an identical stylesheet object."""
+    return _THEMES[theme]
+
+# Virtual interface markers folded into one alternation, so the hidden
+# check below is a single C-level scan instead of seven substring tests.
+_VIRTUAL_NET_RE = re.compile(r'virbr|docker|veth|tun|tap|tailscale|wg')
+
+# Category per top byte of the 24-bit PCI class value, expanded to a
+# dense 256-entry tuple so lookup is a plain index with no hashing.
+_PCI_CATEGORIES = tuple({
+    0x00: 'Other devices', 0x01: 'Storage controllers', 0x02: 'Network adapters',
+    0x03: 'Display adapters', 0x04: 'Sound, video and game controllers',
+    0x05: 'Memory Controllers (System)',
+    0x07: 'Communication controllers',
+    0x09: 'Input devices', 0x0c: 'Universal Serial Bus controllers'
+}.get(code, 'System devices') for code in range(256))
+
+# Category-specific status predicates: take (sys_name, is_hidden, is_physical)
+# defaults and return the final (is_hidden, is_physical) pair.
+def _net_status(name, hidden, physical):
+    if _VIRTUAL_NET_RE.search(name): return True, False
+    if name == 'lo': return True, physical
+    return hidden, physical
+
+def _disk_status(name, hidden, physical):
+    if name.startswith(('loop', 'ram', 'dm-')): return True, False
+    return hidden, physical
+
+@functools.lru_cache(maxsize=1)
+def _tty_with_resources():
+    """Platform UARTs backed by real ioport resources, in one scandir.
+
+    Cached per scan (the scanner clears it) so the Ports predicate is a
+    set lookup instead of a stat chain per tty."""
+    try:
+        return frozenset(e.name for e in os.scandir('/sys/class/tty')
+                         if os.path.lexists(e.path + '/device/resources'))
+    except OSError:
+        return frozenset()
+
+@functools.lru_cache(maxsize=1)
+def _cpu_info():
+    """Model string and schedulable-core count; invariant for the process."""
+    model = "Processor"
+    try:
+        # Prefix check beats a substring scan, and the first core's entry
+        # is all we need, so stop reading as soon as it shows up.
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    model = line.split(':', 1)[1].strip()
+                    break
+    except OSError: pass
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+    return model, count
 
 # --- Backend: EDID Parser (Monitors) ---
 class EdidParser:
@@ -61,6 +149,13 @@ class EdidParser:
         return None
 
 # --- Backend: DMI Parser (RAM) ---
+_DMI_KV = re.compile(rb'^\s*(Size|Type|Speed|Manufacturer|Part Number|Locator):\s*(.+?)\s*$', re.M)
+# dmidecode label -> stick dict field
+_DMI_FIELDS = {
+    b'Size': 'Size', b'Type': 'Type', b'Speed': 'Speed',
+    b'Manufacturer': 'Manufacturer', b'Part Number': 'Part', b'Locator': 'Slot',
+}
+
 class DmiParser:
     """
     Handles 'dmidecode' to read RAM stick info.
@@ -74,54 +169,121 @@ class DmiParser:
         modules = []
         try:
             cmd = ['dmidecode', '-t', '17']
-            output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL).decode('utf-8')
-
-            current_stick = {}
-            for line in output.splitlines():
-                line = line.strip()
-                if "Memory Device" in line:
-                    if current_stick: modules.append(current_stick)
-                    current_stick = {'Name': 'Unknown RAM', 'Size': 'Unknown', 'Type': 'Unknown', 'Speed': 'Unknown'}
-                elif not current_stick:
-                    continue
-
-                if ":" in line:
-                    k, v = [x.strip() for x in line.split(':', 1)]
-                    if k == "Size": current_stick['Size'] = v
-                    elif k == "Type": current_stick['Type'] = v
-                    elif k == "Speed": current_stick['Speed'] = v
-                    elif k == "Manufacturer": current_stick['Manufacturer'] = v
-                    elif k == "Part Number": current_stick['Part'] = v
-                    elif k == "Locator": current_stick['Slot'] = v
-
-            if current_stick: modules.append(current_stick)
+            output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
+
+            # One regex scan per "Memory Device" section over raw bytes
+            # instead of per-line strip+split of the decoded text.
+            for section in output.split(b'Memory Device')[1:]:
+                current_stick = {'Name': 'Unknown RAM', 'Size': 'Unknown', 'Type': 'Unknown', 'Speed': 'Unknown'}
+                for key, value in _DMI_KV.findall(section):
+                    field = _DMI_FIELDS.get(key)
+                    if field: current_stick[field] = value.decode('utf-8', 'ignore')
+                modules.append(current_stick)
         except:
             pass
 
         return modules
 
 # --- Backend: Native System Resolver ---
+# Vendor lines are '<id>  <name>'; device lines are tab-indented. Subsystem
+# lines start with two tabs, so their second character never matches [0-9a-f].
+_PCI_IDS_LINE = re.compile(rb'^([0-9a-f]{4})  (.+?)\s*$|^\t([0-9a-f]{4})  (.+?)\s*$', re.M)
+
 class SystemResolver:
-    """Resolves PCI IDs to human readable names using lspci."""
+    """Resolves PCI IDs to human readable names using the system pci.ids database."""
+
+    PCI_IDS_PATHS = [
+        "/usr/share/hwdata/pci.ids",
+        "/usr/share/misc/pci.ids",
+        "/usr/share/pci.ids",
+    ]
+
     def __init__(self):
-        self.has_lspci = shutil.which('lspci') is not None
         self.pci_cache = {}
+        # Loaded lazily on the first lookup miss: the database is only
+        # needed once a scan actually resolves PCI names, which happens on
+        # the scanner thread instead of during window construction.
+        self.pci_vendors = None
+        self.pci_devices = None
+
+    def _ensure_loaded(self):
+        if self.pci_vendors is None:
+            self.pci_vendors, self.pci_devices = self._load_ids()
+
+    def _load_ids(self):
+        """Loads the pci.ids tables, going through an on-disk cache when fresh."""
+        path = next((p for p in self.PCI_IDS_PATHS if os.path.exists(p)), None)
+        if not path: return {}, {}
+
+        # Key the cache on the source file's identity so distro updates of
+        # pci.ids invalidate it automatically.
+        try:
+            key = (path, os.path.getmtime(path), os.path.getsize(path))
+        except OSError:
+            key = None
+
+        cache_file = os.path.join(IDS_CACHE_DIR, "pci_ids.pickle")
+        if key:
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached_key, vendors, devices = pickle.load(f)
+                if cached_key == key: return vendors, devices
+            except: pass
+
+        vendors, devices = self._parse_ids(path)
+
+        if key and vendors:
+            try:
+                os.makedirs(IDS_CACHE_DIR, exist_ok=True)
+                with open(cache_file, 'wb') as f:
+                    pickle.dump((key, vendors, devices), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except: pass
+
+        return vendors, devices
+
+    def _parse_ids(self, path):
+        """Parses pci.ids into {vendor_id: name} and {(vendor_id, device_id): name}.
+
+        Two flat dicts instead of one dict-of-dicts: one hashtable per
+        database rather than one per vendor, and device lookups become a
+        single tuple-keyed get.
+        """
+        vendors = {}
+        devices = {}
+        try:
+            # One compiled-regex scan over the mmap'd file keeps the ~25k
+            # per-line branch decisions inside the regex engine.
+            with open(path, 'rb') as f:
+                buf = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+            try:
+                current_vendor = None
+                for m in _PCI_IDS_LINE.finditer(buf):
+                    ven_id, ven_name, dev_id, dev_name = m.groups()
+                    if ven_id is not None:
+                        current_vendor = sys.intern(ven_id.decode('latin-1'))
+                        vendors[current_vendor] = ven_name.decode('latin-1')
+                    elif current_vendor:
+                        devices[(current_vendor, dev_id.decode('latin-1'))] = dev_name.decode('latin-1')
+            finally:
+                buf.close()
+        except: pass
+        return vendors, devices
 
     def get_pci_name(self, pci_slot_name):
-        if not self.has_lspci or not pci_slot_name: return None, None
+        if not pci_slot_name: return None, None
         if pci_slot_name in self.pci_cache: return self.pci_cache[pci_slot_name]
 
+        self._ensure_loaded()
         try:
-            output = subprocess.check_output(
-                ['lspci', '-s', pci_slot_name, '-vmm'],
-                stderr=subprocess.DEVNULL
-            ).decode('utf-8')
+            base = f"/sys/bus/pci/devices/{pci_slot_name}"
+            with open(f"{base}/vendor") as f:
+                ven_id = f.read().strip().replace('0x', '')
+            with open(f"{base}/device") as f:
+                dev_id = f.read().strip().replace('0x', '')
 
-            vendor = None
-            device = None
-            for line in output.splitlines():
-                if line.startswith('Vendor:'): vendor = line.split(':', 1)[1].strip()
-                elif line.startswith('Device:'): device = line.split(':', 1)[1].strip()
+            # Table missing or ID unknown: fall back to the raw hex IDs.
+            vendor = self.pci_vendors.get(ven_id, ven_id)
+            device = self.pci_devices.get((ven_id, dev_id), dev_id)
 
             self.pci_cache[pci_slot_name] = (vendor, device)
             return vendor, device
@@ -130,16 +292,47 @@ class SystemResolver:
 # --- Helper: Icon Factory ---
 class IconFactory:
     """Handles loading icons from the Linux theme or internal fallbacks."""
+
+    _overlay_cache = {}
+    _fallback_cache = {}
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get(name_list, fallback_style_standard):
+        # fromTheme alone resolves a name in one theme-engine dispatch;
+        # the old hasThemeIcon pre-check doubled the cost of every name.
         for name in name_list:
-            if QIcon.hasThemeIcon(name): return QIcon.fromTheme(name)
-        return QApplication.style().standardIcon(fallback_style_standard)
+            icon = QIcon.fromTheme(name)
+            if not icon.isNull():
+                return icon
+        # Style standard icons are shared across name tuples, so build
+        # each of those at most once too.
+        fallback = IconFactory._fallback_cache.get(fallback_style_standard)
+        if fallback is None:
+            fallback = QApplication.style().standardIcon(fallback_style_standard)
+            IconFactory._fallback_cache[fallback_style_standard] = fallback
+        return fallback
+
+    @staticmethod
+    def base_pixmap(icon, size=32):
+        """Rasterizes an icon once per size via the app-wide QPixmapCache."""
+        key = f"linman/{icon.cacheKey()}/{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = icon.pixmap(size, size)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
 
     @staticmethod
     def apply_overlay(base_icon, mode='normal'):
         """Adds Ghost (transparent) or Warning (Yellow !) overlays."""
-        pixmap = base_icon.pixmap(32, 32)
+        # Composing runs a full QPixmap + QPainter session; devices in the
+        # same category share the base icon, so cache per (icon, mode).
+        cache_key = (base_icon.cacheKey(), mode)
+        cached = IconFactory._overlay_cache.get(cache_key)
+        if cached is not None: return cached
+
+        pixmap = IconFactory.base_pixmap(base_icon)
         target = QPixmap(pixmap.size())
         target.fill(Qt.transparent)
 
@@ -157,7 +350,59 @@ class IconFactory:
             painter.drawPixmap(16, 16, warn_icon)
 
         painter.end()
-        return QIcon(target)
+        result = QIcon(target)
+        IconFactory._overlay_cache[cache_key] = result
+        return result
+
+# Theme icon candidates + style fallback, keyed by (category, variant) where
+# the variant is 'cat' for headers and 'dev' for device rows. Most rows only
+# differ between the two variants in a handful of categories, so one table
+# with per-variant defaults replaces the two previous mapping dicts.
+_ICON_TABLE = {
+    ('Network adapters', 'cat'): (('network-wired', 'network-workgroup'), QStyle.SP_ComputerIcon),
+    ('Display adapters', 'cat'): (('video-display', 'video-x-generic'), QStyle.SP_DesktopIcon),
+    ('Disk drives', 'cat'): (('drive-harddisk', 'media-optical'), QStyle.SP_DriveHDIcon),
+    ('Processors', 'cat'): (('cpu', 'computer'), QStyle.SP_ComputerIcon),
+    ('Sound, video and game controllers', 'cat'): (('audio-card', 'multimedia-player'), QStyle.SP_MediaVolume),
+    ('Universal Serial Bus controllers', 'cat'): (('drive-removable-media', 'media-flash'), QStyle.SP_DriveCDIcon),
+    ('Keyboards', 'cat'): (('input-keyboard',), QStyle.SP_ComputerIcon),
+    ('Mice and other pointing devices', 'cat'): (('input-mouse',), QStyle.SP_ComputerIcon),
+    ('Bluetooth', 'cat'): (('bluetooth', 'network-wireless'), QStyle.SP_ComputerIcon),
+    ('Batteries', 'cat'): (('battery',), QStyle.SP_TitleBarNormalButton),
+    ('Ports (COM & LPT)', 'cat'): (('modem',), QStyle.SP_ComputerIcon),
+    ('Cameras', 'cat'): (('camera-web', 'camera-photo'), QStyle.SP_ComputerIcon),
+    ('Monitors', 'cat'): (('video-display',), QStyle.SP_DesktopIcon),
+    ('Memory (RAM Sticks)', 'cat'): (('memory', 'media-flash'), QStyle.SP_DriveCDIcon),
+    ('Memory Controllers (System)', 'cat'): (('applications-system',), QStyle.SP_ComputerIcon),
+
+    ('Display adapters', 'dev'): (('video-display',), QStyle.SP_DesktopIcon),
+    ('Network adapters', 'dev'): (('network-card',), QStyle.SP_ComputerIcon),
+    ('Keyboards', 'dev'): (('input-keyboard',), QStyle.SP_ComputerIcon),
+    ('Mice and other pointing devices', 'dev'): (('input-mouse',), QStyle.SP_ComputerIcon),
+    ('Sound, video and game controllers', 'dev'): (('audio-card',), QStyle.SP_MediaVolume),
+    ('Bluetooth', 'dev'): (('bluetooth',), QStyle.SP_ComputerIcon),
+    ('Disk drives', 'dev'): (('drive-harddisk',), QStyle.SP_DriveHDIcon),
+    ('Universal Serial Bus controllers', 'dev'): (('drive-removable-media-usb',), QStyle.SP_DriveCDIcon),
+    ('Cameras', 'dev'): (('camera-web',), QStyle.SP_ComputerIcon),
+    ('Monitors', 'dev'): (('video-display',), QStyle.SP_DesktopIcon),
+    ('Memory (RAM Sticks)', 'dev'): (('memory',), QStyle.SP_DriveCDIcon),
+}
+_ICON_DEFAULTS = {
+    'cat': (('folder',), QStyle.SP_DirIcon),
+    'dev': (('hardware', 'application-x-executable'), QStyle.SP_FileIcon),
+}
+
+@functools.lru_cache(maxsize=64)
+def _resolve_icon(category, variant):
+    """Resolves a category to its themed icon at most once per app lifetime."""
+    names, fallback = _ICON_TABLE.get((category, variant), _ICON_DEFAULTS[variant])
+    return IconFactory.get(names, fallback)
+
+# Per-item payload stored on tree items. A namedtuple is a fraction of
+# the size of the nine-key dict it replaces (one per device, held alive
+# by the tree) and gives the dialog plain attribute access.
+DeviceInfo = namedtuple('DeviceInfo',
+    'model vendor category sys_path subsystem driver devpath is_hidden is_physical')
 
 # --- UI: Properties Dialog ---
 class PropertiesDialog(QDialog):
@@ -165,7 +410,7 @@ class PropertiesDialog(QDialog):
         super().__init__(parent)
         self.device_data = device_data
         self.icon = icon
-        self.setWindowTitle(f"Properties: {self.device_data.get('MODEL')}")
+        self.setWindowTitle(f"Properties: {self.device_data.model}")
         self.setMinimumSize(600, 600)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         self.setup_ui()
@@ -178,9 +423,12 @@ class PropertiesDialog(QDialog):
         header_layout = QHBoxLayout()
         icon_label = QLabel()
         icon_label.setPixmap(self.icon.pixmap(64, 64))
-        name_text = self.device_data.get('MODEL', 'Unknown Device')
+        name_text = self.device_data.model or 'Unknown Device'
         name_label = QLabel(f"<b>{name_text}</b>")
-        name_label.setStyleSheet("font-size: 14pt; font-weight: bold;")
+        font = name_label.font()
+        font.setPointSize(14)
+        font.setBold(True)
+        name_label.setFont(font)
         name_label.setWordWrap(True)
         header_layout.addWidget(icon_label)
         header_layout.addWidget(name_label)
@@ -207,9 +455,9 @@ class PropertiesDialog(QDialog):
         info_group = QGroupBox("Device Information")
         info_layout = QFormLayout()
 
-        info_layout.addRow("Device Type:", QLabel(self.device_data.get('CATEGORY', 'Unknown')))
-        info_layout.addRow("Manufacturer:", QLabel(self.device_data.get('VENDOR', 'Unknown')))
-        info_layout.addRow("Location:", QLabel(os.path.basename(self.device_data.get('SYS_PATH', 'Unknown'))))
+        info_layout.addRow("Device Type:", QLabel(self.device_data.category or 'Unknown'))
+        info_layout.addRow("Manufacturer:", QLabel(self.device_data.vendor or 'Unknown'))
+        info_layout.addRow("Location:", QLabel(os.path.basename(self.device_data.sys_path or 'Unknown')))
 
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
@@ -218,10 +466,10 @@ class PropertiesDialog(QDialog):
         status_layout = QVBoxLayout()
         status_text = QTextEdit()
 
-        driver = self.device_data.get('DRIVER')
-        is_hidden = self.device_data.get('IS_HIDDEN', False)
-        is_physical = self.device_data.get('IS_PHYSICAL', True)
-        category = self.device_data.get('CATEGORY', '')
+        driver = self.device_data.driver
+        is_hidden = self.device_data.is_hidden
+        is_physical = self.device_data.is_physical
+        category = self.device_data.category
 
         msg = []
 
@@ -248,7 +496,7 @@ class PropertiesDialog(QDialog):
         status_text.setPlainText("\n".join(msg))
         status_text.setReadOnly(True)
         status_text.setMaximumHeight(100)
-        status_text.setStyleSheet("border: 1px solid palette(mid);")
+        status_text.setObjectName("deviceStatus")
         status_layout.addWidget(status_text)
         status_group.setLayout(status_layout)
 
@@ -262,7 +510,7 @@ class PropertiesDialog(QDialog):
 
         driver_group = QGroupBox("Driver")
         driver_layout = QFormLayout()
-        driver_name = self.device_data.get('DRIVER', 'None')
+        driver_name = self.device_data.driver or 'None'
 
         clean_driver_name = driver_name.split(' ')[0] if driver_name else None
 
@@ -324,9 +572,10 @@ class PropertiesDialog(QDialog):
         val_text.setFont(QFont("Monospace"))
 
         def update_text(idx):
-            keys = ['SYS_PATH', 'DEVPATH', 'SUBSYSTEM', 'DRIVER']
+            d = self.device_data
+            vals = (d.sys_path, d.devpath, d.subsystem, d.driver)
             if idx < 4:
-                val_text.setText(str(self.device_data.get(keys[idx], '')))
+                val_text.setText(str(vals[idx] or ''))
             else:
                 val_text.setText(str(self.device_data))
 
@@ -351,20 +600,333 @@ class PropertiesDialog(QDialog):
             QMessageBox.warning(self, "Error", "Action failed.")
 
     def action_unbind(self, driver):
-        subsystem = self.device_data.get('SUBSYSTEM')
+        subsystem = self.device_data.subsystem
         path = f"/sys/bus/{subsystem}/drivers/{driver}/unbind"
-        self.run_root_command(f"echo '{os.path.basename(self.device_data.get('SYS_PATH'))}' > {path}")
+        self.run_root_command(f"echo '{os.path.basename(self.device_data.sys_path)}' > {path}")
 
     def action_reprobe(self):
-        sys_path = self.device_data.get('SYS_PATH')
+        sys_path = self.device_data.sys_path
         self.run_root_command(f"echo add > {sys_path}/uevent")
 
     def action_unload_module(self, mod):
         if QMessageBox.question(self, "Confirm", f"Unload {mod}?") == QMessageBox.Yes:
             self.run_root_command(f"modprobe -r {mod}")
 
+# --- Backend: Fake Device ---
+class _FakeDevice:
+    """Minimal pyudev-device stand-in for synthesized entries (RAM etc.)."""
+
+    __slots__ = ('sys_name', 'sys_path', 'device_path', 'properties')
+
+    def __init__(self, sys_name, sys_path, device_path=None):
+        self.sys_name = sys_name
+        self.sys_path = sys_path
+        self.device_path = device_path if device_path is not None else sys_path
+        self.properties = {}
+
+# --- Backend: Device Scanner ---
+class DeviceScanner(QThread):
+    """
+    Enumerates all hardware off the GUI thread.
+    Keeps the UI responsive while sysfs walks and subprocesses
+    (dmidecode) are running; emits the collected device dict when done.
+    """
+
+    scanned = Signal(dict)
+
+    def __init__(self, context, resolver, is_root, parent=None):
+        super().__init__(parent)
+        self.context = context
+        self.resolver = resolver
+        self.is_root = is_root
+        self._driver_cache = {}
+
+    _STATUS_HANDLERS = {
+        'Ports (COM & LPT)': lambda name, hidden, phys: (
+            not (name.startswith(('ttyUSB', 'ttyACM')) or name in _tty_with_resources()), phys),
+        'Network adapters': _net_status,
+        'Disk drives': _disk_status,
+        'Monitors': lambda name, hidden, phys: (False, True),
+        'Memory': lambda name, hidden, phys: (False, True),
+    }
+
+    def get_device_status_flags(self, device, category):
+        is_hidden = False
+        is_physical = True
+
+        if '/virtual/' in device.sys_path:
+            is_physical = False
+            is_hidden = True
+
+        handler = self._STATUS_HANDLERS.get(category)
+        if handler:
+            return handler(device.sys_name, is_hidden, is_physical)
+
+        return is_hidden, is_physical
+
+    def get_driver_recursive(self, device):
+        # Siblings on the same hub/controller share the parent chain, so
+        # memoize per refresh pass keyed by device path.
+        cached = self._driver_cache.get(device.device_path)
+        if cached is not None: return cached
+
+        result = ('', False)
+        driver = device.properties.get('DRIVER', '')
+        if driver:
+            result = (driver, False)
+        else:
+            curr = device
+            steps = 0
+            while curr.parent and steps < 4:
+                curr = curr.parent
+                driver = curr.properties.get('DRIVER', '')
+                if driver and driver != 'pcieport':
+                    result = (f"{driver} (via parent)", True)
+                    break
+                steps += 1
+
+        self._driver_cache[device.device_path] = result
+        return result
+
+    # Every udev subsystem the scan consumes, gathered in one walk.
+    SCAN_SUBSYSTEMS = ('usb', 'video4linux', 'drm', 'net', 'sound', 'block',
+                       'bluetooth', 'tty', 'input', 'power_supply')
+
+    def run(self):
+        self._driver_cache = {}
+        _tty_with_resources.cache_clear()
+        unique_devices = {}
+
+        # One libudev enumeration for every subsystem we consume (matches
+        # are OR'ed), partitioned into per-subsystem buckets so processing
+        # order below stays the same as the old one-walk-per-subsystem code.
+        buckets = {sub: [] for sub in self.SCAN_SUBSYSTEMS}
+        enumerator = self.context.list_devices()
+        for sub in self.SCAN_SUBSYSTEMS:
+            enumerator.match_subsystem(sub)
+        for device in enumerator:
+            bucket = buckets.get(device.subsystem)
+            if bucket is not None: bucket.append(device)
+
+        # --- 1. Base Hardware (PCI) ---
+        # Walk /sys/bus/pci/devices directly: libudev stats every node and
+        # loads its udev db entry, but all we need here are the vendor /
+        # device IDs (resolved via pci.ids) and the driver symlink.
+        try:
+            pci_entries = list(os.scandir('/sys/bus/pci/devices'))
+        except OSError:
+            pci_entries = []
+
+        for entry in pci_entries:
+            try:
+                # Entries are symlinks into /sys/devices; derive the udev
+                # device path so child subsystems can still find parents.
+                link = os.readlink(entry.path)
+                device_path = '/devices' + link.split('/devices', 1)[1]
+            except (OSError, IndexError):
+                continue
+
+            ven, dev = self.resolver.get_pci_name(entry.name)
+            if not ven: ven = 'Unknown Vendor'
+            if not dev: dev = 'Unknown Device'
+
+            try:
+                driver = os.path.basename(os.readlink(os.path.join(entry.path, 'driver')))
+            except OSError:
+                driver = ''
+
+            # Read the class attribute here, where we already hold the
+            # directory entry, instead of re-deriving the path later.
+            try:
+                with open(os.path.join(entry.path, 'class')) as f:
+                    pci_class = f.read().strip()
+            except OSError:
+                pci_class = ''
+
+            device = _FakeDevice(entry.name, '/sys' + device_path, device_path)
+            cat = self.determine_pci_category(pci_class)
+            self.add_entry(unique_devices, device, dev, ven, cat, 'pci', driver)
+
+        # --- 2. USB ---
+        for device in buckets['usb']:
+            if device.device_type == 'usb_device':
+                # Snapshot once: every .properties.get crosses into libudev
+                props = dict(device.properties)
+                ven = props.get('ID_VENDOR_FROM_DATABASE', props.get('ID_VENDOR', 'USB Vendor'))
+                dev = props.get('ID_MODEL_FROM_DATABASE', props.get('ID_MODEL', 'USB Device'))
+                driver, _ = self.get_driver_recursive(device)
+                self.add_entry(unique_devices, device, dev, ven, 'Universal Serial Bus controllers', 'usb', driver)
+
+        # --- 3. Cameras (Webcams) ---
+        for device in buckets['video4linux']:
+            if not device.sys_name.startswith('video'): continue
+            props = dict(device.properties)
+            name = props.get('ID_V4L_PRODUCT')
+            if not name: name = props.get('ID_MODEL', 'Webcam').replace('_', ' ')
+            vendor = props.get('ID_VENDOR', 'Generic')
+            driver, _ = self.get_driver_recursive(device)
+            self.add_entry(unique_devices, device, name, vendor, 'Cameras', 'video4linux', driver)
+
+        # --- 4. Monitors (DRM EDID) ---
+        # Connectors come back from udev with resolved paths, so no manual
+        # /sys/class/drm listing or realpath symlink walking is needed.
+        for device in buckets['drm']:
+            if "-" not in device.sys_name: continue
+            try:
+                status = device.attributes.get('status')
+                if status and status.strip() == b'connected':
+                    real_name = EdidParser.get_monitor_name(device.sys_path)
+                    if not real_name: real_name = f"Generic Monitor ({device.sys_name})"
+                    self.add_entry(unique_devices, device, real_name, "Standard Monitor Types", "Monitors", "drm", "monitor-driver")
+            except: pass
+
+        # --- 5. Memory (RAM) ---
+        # Logic: If Root, DmiParser gives us sticks. If User, it gives [].
+        ram_modules = DmiParser.get_ram_modules()
+
+        if ram_modules:
+            # We are ROOT and have data
+            for i, mod in enumerate(ram_modules):
+                if "No Module" in mod.get('Size', ''): continue
+                name = f"{mod.get('Size')} {mod.get('Type')} {mod.get('Speed')}"
+                path = f"/sys/devices/system/memory/stick_{i}"
+                fake_mem = _FakeDevice(f'ram_{i}', path)
+                self.add_entry(unique_devices, fake_mem, name, mod.get('Manufacturer', 'Unknown'), "Memory (RAM Sticks)", "memory", "ram")
+        else:
+            # We are USER (or dmidecode failed), show Fallback Total
+            try:
+                with open('/proc/meminfo') as f:
+                    total_mem = next((line.split(':')[1].strip() for line in f if "MemTotal" in line), "Unknown")
+                try:
+                    kb = int(total_mem.split()[0])
+                    gb = kb / (1024 * 1024)
+                    mem_str = f"{gb:.1f} GB"
+                except:
+                    mem_str = total_mem
+
+                fake_mem = _FakeDevice('mem_sys', '/sys/devices/system/memory', '/sys/devices/system/memory/ram')
+                label = f"System Memory ({mem_str})"
+                vendor_hint = "System" if self.is_root else "System (Switch to Root for details)"
+                self.add_entry(unique_devices, fake_mem, label, vendor_hint, "Memory (RAM Sticks)", "memory", "ram")
+            except: pass
+
+        # --- 6. Subsystems ---
+        # drm/sound/bluetooth devices matter here only to re-tag a parent
+        # entry (usually the PCI function). Collect those overrides in one
+        # pass over the three buckets -- each .parent hop is an FFI call
+        # plus a fresh wrapper object -- and apply them in a single sweep.
+        overrides = {}
+        for device in buckets['drm'] + buckets['sound'] + buckets['bluetooth']:
+            sub = device.subsystem
+            if sub == 'drm':
+                parent = device.parent
+                if parent and parent.device_path in unique_devices:
+                    overrides.setdefault(parent.device_path, {})['category'] = 'Display adapters'
+            elif sub == 'sound':
+                if 'card' not in device.sys_name: continue
+                curr = device
+                while curr.parent:
+                    curr = curr.parent
+                    if curr.device_path in unique_devices:
+                        overrides.setdefault(curr.device_path, {})['category'] = 'Sound, video and game controllers'
+                        break
+            elif 'hci' in device.sys_name:
+                parent = device.parent
+                if parent and parent.device_path in unique_devices:
+                    overrides.setdefault(parent.device_path, {}).update(
+                        category='Bluetooth', name='Bluetooth Adapter')
+
+        for device in buckets['net']:
+            self.handle_child(unique_devices, device, 'Network adapters')
+
+        for device in buckets['block']:
+            if device.device_type == 'disk':
+                self.handle_child(unique_devices, device, 'Disk drives', force_new=True)
+
+        for device in buckets['tty']:
+             self.handle_child(unique_devices, device, 'Ports (COM & LPT)', force_new=True, fmt="Communications Port ({})")
+
+        for path, ov in overrides.items():
+            unique_devices[path].update(ov)
+
+        for device in buckets['input']:
+            if device.sys_name.startswith('input'):
+                props = dict(device.properties)
+                cat = None
+                if props.get('ID_INPUT_KEYBOARD') == '1': cat = 'Keyboards'
+                elif props.get('ID_INPUT_MOUSE') == '1': cat = 'Mice and other pointing devices'
+                if cat:
+                    name = props.get('NAME', 'Input Device').strip('"')
+                    driver, _ = self.get_driver_recursive(device)
+                    self.add_entry(unique_devices, device, name, '', cat, 'input', driver)
+
+        for device in buckets['power_supply']:
+            if device.properties.get('POWER_SUPPLY_TYPE') == 'Battery':
+                self.add_entry(unique_devices, device, f"Battery ({device.sys_name})", '', 'Batteries', 'power', 'battery')
+
+        # Processors
+        # Model and core count never change at runtime, so they are read
+        # once per process; sched_getaffinity also respects cgroup limits.
+        model, count = _cpu_info()
+        # Every logical CPU shares the same record except for its path,
+        # so fill the dict directly instead of building a fake device
+        # and re-deriving status flags per core (Processors are always
+        # visible physical devices).
+        for i in range(count):
+            path = f"/sys/devices/system/cpu/cpu{i}"
+            unique_devices[path] = {
+                'name': model, 'vendor': 'Intel/AMD', 'category': 'Processors',
+                'sys_path': path, 'subsystem': 'cpu', 'driver': 'processor',
+                'is_hidden': False, 'is_physical': True, 'devpath': path
+            }
+
+        self.scanned.emit(unique_devices)
+
+    def add_entry(self, db, device, name, vendor, cat, sub, driver):
+        is_hidden, is_physical = self.get_device_status_flags(device, cat)
+
+        db[device.device_path] = {
+            'name': name, 'vendor': vendor, 'category': cat,
+            'sys_path': device.sys_path, 'subsystem': sub,
+            'driver': driver, 'is_hidden': is_hidden, 'is_physical': is_physical,
+            'devpath': device.device_path
+        }
+
+    def handle_child(self, db, device, category, force_new=False, fmt="{}"):
+        driver, _ = self.get_driver_recursive(device)
+        if not force_new:
+            curr = device
+            found_parent = False
+            for _ in range(3):
+                parent = curr.parent
+                if parent and parent.device_path in db:
+                    db[parent.device_path]['category'] = category
+                    if not db[parent.device_path]['driver'] and driver:
+                        db[parent.device_path]['driver'] = driver
+                    found_parent = True
+                    break
+                if parent: curr = parent
+                else: break
+            if found_parent: return
+
+        props = dict(device.properties)
+        name = props.get('ID_MODEL', device.sys_name).replace('_', ' ')
+        if fmt != "{}": name = fmt.format(device.sys_name)
+        self.add_entry(db, device, name, props.get('ID_VENDOR', ''), category, device.subsystem, driver)
+
+    def determine_pci_category(self, pci_class):
+        if not pci_class: return 'System devices'
+        # The class is a 24-bit hex value (with or without 0x prefix);
+        # take the top byte numerically instead of string slicing.
+        try:
+            code = (int(pci_class, 16) >> 16) & 0xff
+        except ValueError:
+            return 'System devices'
+        return _PCI_CATEGORIES[code]
+
 # --- Main Window ---
 class MainWindow(QMainWindow):
+
     def __init__(self):
         super().__init__()
 
@@ -384,6 +946,11 @@ class MainWindow(QMainWindow):
         self.resolver = SystemResolver()
         self.categories = {}
         self.show_hidden = False
+        self._scanner = None
+        self._rescan_pending = False
+        self._last_devices = {}
+        self._items_by_path = {}
+        self._icon_variants = {}
 
         self.setup_ui()
         self.setup_monitor()
@@ -454,6 +1021,8 @@ class MainWindow(QMainWindow):
         self.root_item.setIcon(0, self.style().standardIcon(QStyle.SP_ComputerIcon))
         self.root_item.setExpanded(True)
 
+        self.setup_context_menus()
+
     def restart_as_root(self):
         msg = "Restart LinMan in Root Mode?\n\nCheck your taskbar for the password prompt."
         if QMessageBox.question(self, "Root Mode", msg, QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
@@ -491,6 +1060,12 @@ class MainWindow(QMainWindow):
 
     def setup_monitor(self):
         try:
+            # One restartable timer coalesces udev bursts (a hub plug fires
+            # dozens of events) into a single refresh once things settle.
+            self._refresh_timer = QTimer(self)
+            self._refresh_timer.setSingleShot(True)
+            self._refresh_timer.timeout.connect(self.refresh_devices)
+
             self.monitor = pyudev.Monitor.from_netlink(self.context)
             self.monitor.filter_by(subsystem='usb')
             self.monitor.filter_by(subsystem='input')
@@ -502,14 +1077,45 @@ class MainWindow(QMainWindow):
     @Slot()
     def on_hardware_change(self):
         try:
-            self.monitor.receive_device()
-            QTimer.singleShot(1000, self.refresh_devices)
+            # Drain everything queued so the notifier doesn't wake us once
+            # per event; restart the debounce countdown only if at least
+            # one event could actually alter the rendered tree.
+            relevant = False
+            while True:
+                dev = self.monitor.poll(0)
+                if dev is None: break
+                if relevant: continue
+                relevant = self._event_matters(dev)
+            if relevant:
+                self._refresh_timer.start(250)
         except: pass
 
+    def _event_matters(self, dev):
+        """False for udev noise: a 'change' on a device we already show
+        with the same driver cannot move, add or remove a tree row."""
+        try:
+            if dev.action != 'change': return True
+            entry = self._last_devices.get(dev.device_path)
+            if entry is None: return True
+            driver = dev.properties.get('DRIVER', '')
+            return bool(driver) and not entry['driver'].startswith(driver)
+        except:
+            return True
+
     def toggle_hidden_devices(self, checked):
         self.show_hidden = checked
         self.refresh_devices()
 
+    def closeEvent(self, event):
+        # Destroying a still-running QThread aborts the whole process
+        # (qFatal in ~QThread), and root scans can sit on dmidecode for
+        # a while; block the close until an in-flight scan drains.
+        # wait() on an already-finished thread returns immediately.
+        self._rescan_pending = False
+        if self._scanner:
+            self._scanner.wait()
+        super().closeEvent(event)
+
     def show_about(self):
         QMessageBox.about(self, "About LinMan",
             f"<b>LinMan - Linux Device Manager</b><br>"
@@ -517,359 +1123,265 @@ class MainWindow(QMainWindow):
             f"A native Hardware Manager for Linux systems.<br><br>"
             f"<a href='{GITHUB_URL}'>{GITHUB_URL}</a>")
 
-    def get_device_status_flags(self, device, category):
-        name = device.sys_name
-        sys_path = device.sys_path
-
-        is_hidden = False
-        is_physical = True
-
-        if '/virtual/' in sys_path:
-            is_physical = False
-            is_hidden = True
-
-        if category == 'Ports (COM & LPT)':
-            if name.startswith(('ttyUSB', 'ttyACM')): is_hidden = False
-            else: is_hidden = True
-
-        if category == 'Network adapters':
-            if name == 'lo': is_hidden = True
-            if any(x in name for x in ['virbr', 'docker', 'veth', 'tun', 'tap', 'tailscale', 'wg']):
-                is_hidden = True
-                is_physical = False
-
-        if category == 'Disk drives':
-            if name.startswith(('loop', 'ram', 'dm-')):
-                is_hidden = True
-                is_physical = False
-
-        if category == 'Monitors' or category == 'Memory':
-            is_physical = True
-            is_hidden = False
-
-        return is_hidden, is_physical
-
-    def get_driver_recursive(self, device):
-        driver = device.properties.get('DRIVER', '')
-        if driver: return driver, False
-
-        curr = device
-        steps = 0
-        while curr.parent and steps < 4:
-            curr = curr.parent
-            driver = curr.properties.get('DRIVER', '')
-            if driver and driver != 'pcieport':
-                return f"{driver} (via parent)", True
-            steps += 1
-        return '', False
-
     def refresh_devices(self):
-        self.root_item.takeChildren()
-        self.categories = {}
-        unique_devices = {}
-
-        # --- 1. Base Hardware (PCI) ---
-        for device in self.context.list_devices(subsystem='pci'):
-            ven = device.properties.get('ID_VENDOR_FROM_DATABASE')
-            dev = device.properties.get('ID_MODEL_FROM_DATABASE')
-            if not ven or not dev:
-                ven, dev = self.resolver.get_pci_name(device.sys_name)
-            if not ven: ven = device.properties.get('ID_VENDOR_ID', 'Unknown Vendor')
-            if not dev: dev = device.properties.get('ID_MODEL_ID', 'Unknown Device')
-
-            cat = self.determine_pci_category(device)
-            driver = device.properties.get('DRIVER', '')
-
-            self.add_entry(unique_devices, device, dev, ven, cat, 'pci', driver)
-
-        # --- 2. USB ---
-        for device in self.context.list_devices(subsystem='usb'):
-            if device.device_type == 'usb_device':
-                ven = device.properties.get('ID_VENDOR_FROM_DATABASE', device.properties.get('ID_VENDOR', 'USB Vendor'))
-                dev = device.properties.get('ID_MODEL_FROM_DATABASE', device.properties.get('ID_MODEL', 'USB Device'))
-                driver, _ = self.get_driver_recursive(device)
-                self.add_entry(unique_devices, device, dev, ven, 'Universal Serial Bus controllers', 'usb', driver)
-
-        # --- 3. Cameras (Webcams) ---
-        for device in self.context.list_devices(subsystem='video4linux'):
-            if not device.sys_name.startswith('video'): continue
-            name = device.properties.get('ID_V4L_PRODUCT')
-            if not name: name = device.properties.get('ID_MODEL', 'Webcam').replace('_', ' ')
-            vendor = device.properties.get('ID_VENDOR', 'Generic')
-            driver, _ = self.get_driver_recursive(device)
-            self.add_entry(unique_devices, device, name, vendor, 'Cameras', 'video4linux', driver)
+        """Kicks off a background scan; the tree is rebuilt when it reports back."""
+        # The reference is cleared only by _on_scan_finished, never by
+        # isRunning() polling: between run() returning and the queued
+        # finished delivery, isRunning() already reads false and would
+        # let a second scanner start concurrently.
+        if self._scanner:
+            # A hotplug that lands mid-scan would be lost if we just
+            # dropped it; remember it and rescan once this pass is done.
+            self._rescan_pending = True
+            return
 
-        # --- 4. Monitors (DRM EDID) ---
-        drm_path = "/sys/class/drm"
-        if os.path.exists(drm_path):
-            for conn in os.listdir(drm_path):
-                if "-" in conn and os.path.exists(f"{drm_path}/{conn}/status"):
-                    try:
-                        with open(f"{drm_path}/{conn}/status") as f: status = f.read().strip()
-                        if status == "connected":
-                            real_name = EdidParser.get_monitor_name(f"{drm_path}/{conn}")
-                            if not real_name: real_name = f"Generic Monitor ({conn})"
-                            card_path = os.path.realpath(f"{drm_path}/{conn}")
-                            fake_device = type('obj', (object,), {'sys_name': conn, 'sys_path': card_path, 'device_path': card_path, 'properties': {}})
-                            self.add_entry(unique_devices, fake_device, real_name, "Standard Monitor Types", "Monitors", "drm", "monitor-driver")
-                    except: pass
+        self._rescan_pending = False
+        self._scanner = DeviceScanner(self.context, self.resolver, self.is_root, self)
+        self._scanner.scanned.connect(self.render_devices)
+        self._scanner.finished.connect(self._on_scan_finished)
+        # Finished scanners free themselves; without this every refresh
+        # parks another dead QThread under the window until exit.
+        self._scanner.finished.connect(self._scanner.deleteLater)
+        self._scanner.start()
 
-        # --- 5. Memory (RAM) ---
-        # Logic: If Root, DmiParser gives us sticks. If User, it gives [].
-        ram_modules = DmiParser.get_ram_modules()
-
-        if ram_modules:
-            # We are ROOT and have data
-            for i, mod in enumerate(ram_modules):
-                if "No Module" in mod.get('Size', ''): continue
-                name = f"{mod.get('Size')} {mod.get('Type')} {mod.get('Speed')}"
-                path = f"/sys/devices/system/memory/stick_{i}"
-                fake_mem = type('obj', (object,), {'sys_name': f'ram_{i}', 'sys_path': path, 'device_path': path})
-                self.add_entry(unique_devices, fake_mem, name, mod.get('Manufacturer', 'Unknown'), "Memory (RAM Sticks)", "memory", "ram")
+    @Slot()
+    def _on_scan_finished(self):
+        # Drop our reference before the queued deleteLater lands, so no
+        # later refresh pokes at a deleted C++ object.
+        self._scanner = None
+        if self._rescan_pending:
+            self.refresh_devices()
+
+    @Slot(dict)
+    def render_devices(self, unique_devices):
+        visible = {path: d for path, d in unique_devices.items()
+                   if self.show_hidden or not d.get('is_hidden')}
+
+        if not self._items_by_path:
+            self._render_full(visible)
         else:
-            # We are USER (or dmidecode failed), show Fallback Total
-            try:
-                with open('/proc/meminfo') as f:
-                    total_mem = next((line.split(':')[1].strip() for line in f if "MemTotal" in line), "Unknown")
-                try:
-                    kb = int(total_mem.split()[0])
-                    gb = kb / (1024 * 1024)
-                    mem_str = f"{gb:.1f} GB"
-                except:
-                    mem_str = total_mem
-
-                fake_mem = type('obj', (object,), {'sys_name': 'mem_sys', 'sys_path': '/sys/devices/system/memory', 'device_path': '/sys/devices/system/memory/ram'})
-                label = f"System Memory ({mem_str})"
-                vendor_hint = "System" if self.is_root else "System (Switch to Root for details)"
-                self.add_entry(unique_devices, fake_mem, label, vendor_hint, "Memory (RAM Sticks)", "memory", "ram")
-            except: pass
-
-        # --- 6. Subsystems ---
-        for device in self.context.list_devices(subsystem='drm'):
-            if device.parent and device.parent.device_path in unique_devices:
-                unique_devices[device.parent.device_path]['category'] = 'Display adapters'
-
-        for device in self.context.list_devices(subsystem='net'):
-            self.handle_child(unique_devices, device, 'Network adapters')
-
-        for device in self.context.list_devices(subsystem='sound'):
-            if 'card' in device.sys_name:
-                curr = device
-                while curr.parent:
-                    curr = curr.parent
-                    if curr.device_path in unique_devices:
-                        unique_devices[curr.device_path]['category'] = 'Sound, video and game controllers'
-                        break
-
-        for device in self.context.list_devices(subsystem='block'):
-            if device.device_type == 'disk':
-                self.handle_child(unique_devices, device, 'Disk drives', force_new=True)
-
-        for device in self.context.list_devices(subsystem='bluetooth'):
-            if 'hci' in device.sys_name:
-                if device.parent and device.parent.device_path in unique_devices:
-                    unique_devices[device.parent.device_path]['category'] = 'Bluetooth'
-                    unique_devices[device.parent.device_path]['name'] = 'Bluetooth Adapter'
-
-        for device in self.context.list_devices(subsystem='tty'):
-             self.handle_child(unique_devices, device, 'Ports (COM & LPT)', force_new=True, fmt="Communications Port ({})")
-
-        for device in self.context.list_devices(subsystem='input'):
-            if device.sys_name.startswith('input'):
-                props = device.properties
-                cat = None
-                if props.get('ID_INPUT_KEYBOARD') == '1': cat = 'Keyboards'
-                elif props.get('ID_INPUT_MOUSE') == '1': cat = 'Mice and other pointing devices'
-                if cat:
-                    name = props.get('NAME', 'Input Device').strip('"')
-                    driver, _ = self.get_driver_recursive(device)
-                    self.add_entry(unique_devices, device, name, '', cat, 'input', driver)
-
-        for device in self.context.list_devices(subsystem='power_supply'):
-            if device.properties.get('POWER_SUPPLY_TYPE') == 'Battery':
-                self.add_entry(unique_devices, device, f"Battery ({device.sys_name})", '', 'Batteries', 'power', 'battery')
-
-        # Processors
-        try:
-            with open('/proc/cpuinfo') as f:
-                model = next((line.split(':')[1].strip() for line in f if "model name" in line), "Processor")
-            for i in range(os.cpu_count() or 1):
-                path = f"/sys/devices/system/cpu/cpu{i}"
-                fake_dev = type('obj', (object,), {'sys_name': f'cpu{i}', 'sys_path': path, 'device_path': path})
-                self.add_entry(unique_devices, fake_dev, model, 'Intel/AMD', 'Processors', 'cpu', 'processor')
-        except: pass
-
-        # --- Render ---
-        for data in sorted(unique_devices.values(), key=lambda x: (x['category'], x['name'])):
-            if data.get('is_hidden') and not self.show_hidden: continue
-            self.add_device_to_tree(data)
+            self._render_diff(visible)
+        self._last_devices = visible
         self.root_item.setExpanded(True)
 
-    def add_entry(self, db, device, name, vendor, cat, sub, driver):
-        is_hidden, is_physical = self.get_device_status_flags(device, cat)
-
-        db[device.device_path] = {
-            'name': name, 'vendor': vendor, 'category': cat,
-            'sys_path': device.sys_path, 'subsystem': sub,
-            'driver': driver, 'is_hidden': is_hidden, 'is_physical': is_physical,
-            'devpath': device.device_path
-        }
-
-    def handle_child(self, db, device, category, force_new=False, fmt="{}"):
-        driver, _ = self.get_driver_recursive(device)
-        if not force_new:
-            curr = device
-            found_parent = False
-            for _ in range(3):
-                parent = curr.parent
-                if parent and parent.device_path in db:
-                    db[parent.device_path]['category'] = category
-                    if not db[parent.device_path]['driver'] and driver:
-                        db[parent.device_path]['driver'] = driver
-                    found_parent = True
-                    break
-                if parent: curr = parent
-                else: break
-            if found_parent: return
-
-        name = device.properties.get('ID_MODEL', device.sys_name).replace('_', ' ')
-        if fmt != "{}": name = fmt.format(device.sys_name)
-        self.add_entry(db, device, name, device.properties.get('ID_VENDOR', ''), category, device.subsystem, driver)
-
-    def determine_pci_category(self, device):
-        pci_class = device.properties.get('PCI_CLASS')
-        if not pci_class:
-            try:
-                with open(f"{device.sys_path}/class", 'r') as f: pci_class = f.read().strip()
-            except: pass
-        if not pci_class: return 'System devices'
-        code = pci_class.lower().replace('0x', '').zfill(6)[0:2]
-        mapping = {
-            '00': 'Other devices', '01': 'Storage controllers', '02': 'Network adapters',
-            '03': 'Display adapters', '04': 'Sound, video and game controllers',
-            '05': 'Memory Controllers (System)',
-            '06': 'System devices',
-            '07': 'Communication controllers', '08': 'System devices',
-            '09': 'Input devices', '0c': 'Universal Serial Bus controllers'
-        }
-        return mapping.get(code, 'System devices')
-
-    def add_device_to_tree(self, data):
+    def _render_full(self, visible):
+        # Build items detached from the tree and attach per-category in one
+        # addChildren call, so the view reflows once instead of per insert.
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            self.root_item.takeChildren()
+            self.categories = {}
+            self._items_by_path = {}
+
+            # Bucket by category first and sort each (much smaller) bucket
+            # by name, instead of one global sort over every device.
+            buckets = {}
+            for path, data in visible.items():
+                buckets.setdefault(data['category'], []).append((path, data))
+
+            for cat_name in sorted(buckets):
+                buckets[cat_name].sort(key=lambda x: x[1]['name'])
+                cat_item = QTreeWidgetItem(self.root_item)
+                cat_item.setText(0, cat_name)
+                cat_item.setIcon(0, self.get_category_icon(cat_name))
+                items = []
+                for path, data in buckets[cat_name]:
+                    item = self.create_device_item(data)
+                    self._items_by_path[path] = item
+                    items.append(item)
+                cat_item.addChildren(items)
+                self.categories[cat_name] = cat_item
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.viewport().update()
+
+    def _render_diff(self, visible):
+        """Touch only the items whose devices appeared, vanished or changed.
+
+        A hotplug event alters a handful of entries; rebuilding the whole
+        tree would invalidate every row's paint state for nothing. Changed
+        devices are handled as remove + re-insert so a category move ends
+        up under the right header.
+        """
+        old = self._last_devices
+        removed = [p for p in old if p not in visible]
+        added = [p for p in visible if p not in old]
+        changed = [p for p in visible if p in old and visible[p] != old[p]]
+        if not (removed or added or changed): return
+
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            for path in removed + changed:
+                item = self._items_by_path.pop(path, None)
+                if item is None: continue
+                cat_item = item.parent()
+                cat_item.removeChild(item)
+                if cat_item.childCount() == 0:
+                    self.root_item.removeChild(cat_item)
+                    del self.categories[cat_item.text(0)]
+            for path in added + changed:
+                self._insert_device_item(path, visible[path])
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.viewport().update()
+
+    def _insert_device_item(self, path, data):
         cat_name = data['category']
-        if cat_name not in self.categories:
-            cat_item = QTreeWidgetItem(self.root_item)
+        cat_item = self.categories.get(cat_name)
+        if cat_item is None:
+            names = [self.root_item.child(i).text(0) for i in range(self.root_item.childCount())]
+            cat_item = QTreeWidgetItem()
             cat_item.setText(0, cat_name)
             cat_item.setIcon(0, self.get_category_icon(cat_name))
+            self.root_item.insertChild(bisect.bisect_left(names, cat_name), cat_item)
             self.categories[cat_name] = cat_item
 
-        d_item = QTreeWidgetItem(self.categories[cat_name])
-        name = re.sub(' +', ' ', f"{data['vendor']} {data['name']}".strip())
+        item = self.create_device_item(data)
+        names = [cat_item.child(i).data(0, Qt.UserRole + 2) for i in range(cat_item.childCount())]
+        cat_item.insertChild(bisect.bisect_left(names, data['name']), item)
+        self._items_by_path[path] = item
+
+    def _device_icon_variants(self, cat_name):
+        """All rendered states of a category's device icon, built once.
+
+        Every device in a category shares its icon, so the ghost and
+        warning composites are rasterized one time and then handed out
+        as plain dict lookups during item creation."""
+        variants = self._icon_variants.get(cat_name)
+        if variants is None:
+            base = self.get_device_icon(cat_name)
+            variants = {
+                'normal': base,
+                'ghost': IconFactory.apply_overlay(base, 'ghost'),
+                'warning': IconFactory.apply_overlay(base, 'warning'),
+            }
+            self._icon_variants[cat_name] = variants
+        return variants
+
+    def create_device_item(self, data):
+        cat_name = data['category']
+        d_item = QTreeWidgetItem()
+        # split()/join() collapses runs of whitespace in plain C, without
+        # the regex machinery, and strips the ends as a side effect.
+        name = ' '.join(f"{data['vendor']} {data['name']}".split())
         d_item.setText(0, name)
 
-        icon = self.get_device_icon(cat_name)
-
-        if data.get('is_hidden'):
-            icon = IconFactory.apply_overlay(icon, 'ghost')
-
         # --- LOGIC: Handle "Yellow Bang" (!) Icon ---
+        bang = False
         if data.get('is_physical') and not data.get('driver'):
             safe_categories = ['Memory Controllers (System)', 'System devices', 'Processors']
-            if cat_name not in safe_categories:
-                icon = IconFactory.apply_overlay(icon, 'warning')
+            bang = cat_name not in safe_categories
+
+        variants = self._device_icon_variants(cat_name)
+        if data.get('is_hidden'):
+            icon = variants['ghost']
+            if bang: icon = IconFactory.apply_overlay(icon, 'warning')
+        else:
+            icon = variants['warning'] if bang else variants['normal']
 
         d_item.setIcon(0, icon)
 
-        prop_data = {
-            'MODEL': data['name'], 'VENDOR': data['vendor'], 'CATEGORY': cat_name,
-            'SYS_PATH': data.get('sys_path'), 'SUBSYSTEM': data.get('subsystem'),
-            'DRIVER': data.get('driver'), 'DEVPATH': data.get('devpath'),
-            'IS_HIDDEN': data.get('is_hidden'), 'IS_PHYSICAL': data.get('is_physical')
-        }
+        prop_data = DeviceInfo(
+            model=data['name'], vendor=data['vendor'], category=cat_name,
+            sys_path=data.get('sys_path'), subsystem=data.get('subsystem'),
+            driver=data.get('driver'), devpath=data.get('devpath'),
+            is_hidden=data.get('is_hidden'), is_physical=data.get('is_physical'))
         d_item.setData(0, Qt.UserRole, prop_data)
+        # Leaf marker so activation handlers skip headers with one role fetch
+        d_item.setData(0, Qt.UserRole + 1, True)
+        # Raw name as sort key, so diff inserts land in the same order the
+        # full build produces
+        d_item.setData(0, Qt.UserRole + 2, data['name'])
+        return d_item
 
-    def get_category_icon(self, category):
-        mapping = {
-            'Network adapters': (['network-wired', 'network-workgroup'], QStyle.SP_ComputerIcon),
-            'Display adapters': (['video-display', 'video-x-generic'], QStyle.SP_DesktopIcon),
-            'Disk drives': (['drive-harddisk', 'media-optical'], QStyle.SP_DriveHDIcon),
-            'Processors': (['cpu', 'computer'], QStyle.SP_ComputerIcon),
-            'Sound, video and game controllers': (['audio-card', 'multimedia-player'], QStyle.SP_MediaVolume),
-            'Universal Serial Bus controllers': (['drive-removable-media', 'media-flash'], QStyle.SP_DriveCDIcon),
-            'Keyboards': (['input-keyboard'], QStyle.SP_ComputerIcon),
-            'Mice and other pointing devices': (['input-mouse'], QStyle.SP_ComputerIcon),
-            'Bluetooth': (['bluetooth', 'network-wireless'], QStyle.SP_ComputerIcon),
-            'Batteries': (['battery'], QStyle.SP_TitleBarNormalButton),
-            'Ports (COM & LPT)': (['modem'], QStyle.SP_ComputerIcon),
-            'Cameras': (['camera-web', 'camera-photo'], QStyle.SP_ComputerIcon),
-            'Monitors': (['video-display'], QStyle.SP_DesktopIcon),
-            'Memory (RAM Sticks)': (['memory', 'media-flash'], QStyle.SP_DriveCDIcon),
-            'Memory Controllers (System)': (['applications-system'], QStyle.SP_ComputerIcon),
-        }
-        if category in mapping:
-            return IconFactory.get(mapping[category][0], mapping[category][1])
-        return IconFactory.get(['folder'], QStyle.SP_DirIcon)
-
-    def get_device_icon(self, category):
-        mapping = {
-            'Display adapters': (['video-display'], QStyle.SP_DesktopIcon),
-            'Network adapters': (['network-card'], QStyle.SP_ComputerIcon),
-            'Keyboards': (['input-keyboard'], QStyle.SP_ComputerIcon),
-            'Mice and other pointing devices': (['input-mouse'], QStyle.SP_ComputerIcon),
-            'Sound, video and game controllers': (['audio-card'], QStyle.SP_MediaVolume),
-            'Bluetooth': (['bluetooth'], QStyle.SP_ComputerIcon),
-            'Disk drives': (['drive-harddisk'], QStyle.SP_DriveHDIcon),
-            'Universal Serial Bus controllers': (['drive-removable-media-usb'], QStyle.SP_DriveCDIcon),
-            'Cameras': (['camera-web'], QStyle.SP_ComputerIcon),
-            'Monitors': (['video-display'], QStyle.SP_DesktopIcon),
-            'Memory (RAM Sticks)': (['memory'], QStyle.SP_DriveCDIcon),
-        }
-        if category in mapping:
-            return IconFactory.get(mapping[category][0], mapping[category][1])
-        return IconFactory.get(['hardware', 'application-x-executable'], QStyle.SP_FileIcon)
+    @staticmethod
+    def get_category_icon(category):
+        return _resolve_icon(category, 'cat')
+
+    @staticmethod
+    def get_device_icon(category):
+        return _resolve_icon(category, 'dev')
 
     def show_properties(self, item, column):
-        if item.childCount() > 0 or item == self.root_item: return
+        if not item.data(0, Qt.UserRole + 1): return
         device_data = item.data(0, Qt.UserRole)
         if device_data:
             dialog = PropertiesDialog(device_data, item.icon(0), self)
             dialog.exec()
 
-    def show_context_menu(self, position):
-        item = self.tree.itemAt(position)
-        menu = QMenu(self)
+    def setup_context_menus(self):
+        """Builds both context menus once; handlers read self._context_item."""
+        self._context_item = None
+        self._ctx_name = ''
+        self._ctx_path = ''
 
-        # Show device options if it is a leaf node
-        if item and item.childCount() == 0 and item != self.root_item:
-            data = item.data(0, Qt.UserRole)
-            action_props = menu.addAction("Properties")
-            action_props.triggered.connect(lambda: self.show_properties(item, 0))
+        self._ctx_menu = QMenu(self)
+        self._ctx_menu.addAction("Properties").triggered.connect(self._ctx_props)
+        self._ctx_menu.addSeparator()
+        self._ctx_menu.addAction("Copy Name").triggered.connect(self._ctx_copy_name)
+        self._ctx_menu.addAction("Copy Device Path").triggered.connect(self._ctx_copy_path)
 
-            menu.addSeparator()
+        self._scan_menu = QMenu(self)
+        scan_action = self._scan_menu.addAction(self.style().standardIcon(QStyle.SP_BrowserReload), "Scan for hardware changes")
+        scan_action.triggered.connect(self.refresh_devices)
 
-            action_copy_name = menu.addAction("Copy Name")
-            action_copy_name.triggered.connect(lambda: QApplication.clipboard().setText(item.text(0)))
+    def _ctx_props(self):
+        if self._context_item: self.show_properties(self._context_item, 0)
 
-            if data:
-                action_copy_path = menu.addAction("Copy Device Path")
-                action_copy_path.triggered.connect(lambda: QApplication.clipboard().setText(data.get('SYS_PATH', '')))
+    def _ctx_copy_name(self):
+        QApplication.clipboard().setText(self._ctx_name)
 
-        # Show Scan options for whitespace or folders
-        else:
-            action_scan = menu.addAction(self.style().standardIcon(QStyle.SP_BrowserReload), "Scan for hardware changes")
-            action_scan.triggered.connect(self.refresh_devices)
+    def _ctx_copy_path(self):
+        QApplication.clipboard().setText(self._ctx_path)
 
-        if not menu.isEmpty():
-            menu.exec(self.tree.mapToGlobal(position))
+    def show_context_menu(self, position):
+        item = self.tree.itemAt(position)
+
+        # Device options for leaf nodes, scan options for whitespace/folders
+        if item and item.childCount() == 0 and item != self.root_item:
+            # Extract both strings up front so the copy handlers are plain
+            # clipboard writes without another QVariant round-trip.
+            data = item.data(0, Qt.UserRole)
+            self._context_item = item
+            self._ctx_name = item.text(0)
+            self._ctx_path = data.sys_path or '' if data else ''
+            self._ctx_menu.exec(self.tree.mapToGlobal(position))
+        else:
+            self._scan_menu.exec(self.tree.mapToGlobal(position))
 
 def main():
-    app = QApplication(sys.argv)
-    # Enable High DPI
+    # Qt reads its scaling environment when QApplication is constructed,
+    # so High DPI settings must be in place before that.
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+
+    app = QApplication(sys.argv)
+    # Coalesce bursts of input/paint events and skip the menu fade, so
+    # restyles and hover churn trigger fewer paintEvent runs.
+    app.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    app.setAttribute(Qt.AA_CompressTabletEvents, True)
+    app.setEffectEnabled(Qt.UI_AnimateMenu, False)
     # Use Fusion style for neutrality
     app.setStyle("Fusion")
+    # LINMAN_LAZY_STYLE=1 defers the sheet to a zero-timer after show,
+    # so widgets get polished once in a batch instead of one by one as
+    # they are constructed. Off by default: it trades an unstyled first
+    # frame for faster startup on slow systems.
+    lazy_style = os.environ.get("LINMAN_LAZY_STYLE") == "1"
+    if not lazy_style:
+        app.setStyleSheet(_qss('default'))
+    # Room for the rasterized device/category icons (KB)
+    QPixmapCache.setCacheLimit(20480)
 
     window = MainWindow()
     window.show()
+    if lazy_style:
+        QTimer.singleShot(0, lambda: app.setStyleSheet(_qss('default')))
     sys.exit(app.exec())
 
 if __name__ == "__main__":